@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import MagicMock
 from datetime import datetime
+from types import SimpleNamespace
 from NostalgiaForInfinityX5 import NostalgiaForInfinityX5
 
 
@@ -48,7 +49,7 @@ class MockTrade:
   def select_filled_orders(self, side):
     # Simulate returning an empty list of filled orders for the test
     return [
-      MagicMock(average=100.0, amount=1.0),  # Example filled order
+      SimpleNamespace(average=100.0, amount=1.0),  # Example filled order
     ]
 
 
@@ -1,5 +1,5 @@
 import json
-import time
+import os
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
@@ -30,11 +30,12 @@ def test_load_only_when_changed(tmp_path):
 
   # However, if we change the cache file, it SHOULD load the file again
   for n in range(1, 6):
-    # Sleep long enough so that mtime changes
-    time.sleep(0.01)
+    mtime_ns = cache_file.stat().st_mtime_ns
     data = {"bar": {"shots": n}}
     with open(cache_file, "w") as wfh:
       wfh.write(json.dumps(data))
+    # Bump mtime explicitly instead of sleeping until the filesystem clock ticks
+    os.utime(cache_file, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
     assert cache.data != data
     cache.load()
     assert cache.data == data